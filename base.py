@@ -1,22 +1,97 @@
 import os
+import sys
 import csv
 import subprocess
 import shutil
+import bisect
+import queue
+import threading
 import tkinter as tk
 from tkinter import ttk, messagebox, simpledialog
 from dataclasses import dataclass
-import math
 
 CONTACTS_FILE = "contacts.csv"
+CSV_HEADER = ["folder", "name", "ammyadmin_id", "anydesk_id", "rustdesk_id", "notes"]
 DRAG_THRESHOLD = 5  # Pixels after which drag is considered
+_DRAG_THRESHOLD_SQ = DRAG_THRESHOLD * DRAG_THRESHOLD  # Compared with dx*dx + dy*dy, no sqrt needed
+MOTION_INTERVAL_MS = 16  # Pointer motion during drag is processed at most this often
+VIRTUAL_ROWS_MIN = 500  # Folders with this many contacts only get the rows near the view
+VIRTUAL_BUFFER = 50  # Rows kept above and below the view of such folders
+SAVE_DELAY_MS = 250  # Changes made within this interval are written in one go
+SCRIPT_DIR = os.path.abspath(os.path.dirname(__file__))
+
+# Executable file names of the supported programs
+EXE_NAMES = {
+    "ammyadmin": "AmmyyAdmin.exe",
+    "anydesk": "AnyDesk.exe",
+    "rustdesk": "rustdesk.exe",
+}
+# Standard installation locations of the supported programs
+EXE_INSTALL_PATHS = {
+    "ammyadmin": [
+        r"C:\Program Files (x86)\Ammyy Admin\AmmyyAdmin.exe",
+        r"C:\Program Files\Ammyy Admin\AmmyyAdmin.exe",
+    ],
+    "anydesk": [
+        r"C:\Program Files (x86)\AnyDesk\AnyDesk.exe",
+        r"C:\Program Files\AnyDesk\AnyDesk.exe",
+    ],
+    "rustdesk": [
+        r"C:\Program Files\RustDesk\rustdesk.exe",
+        r"C:\Program Files (x86)\RustDesk\rustdesk.exe",
+    ],
+}
+# Contacts table column number -> program launched by double-clicking it
+_PROG_MAP = {2: "ammyadmin", 3: "anydesk", 4: "rustdesk"}
+# Command line flags put before the remote ID
+_LAUNCH_FLAGS = {
+    "ammyadmin": ("-connect",),  # AmmyyAdmin requires -connect flag
+    "anydesk": (),  # AnyDesk accepts just the ID
+    "rustdesk": ("--connect",),  # RustDesk requires --connect flag
+}
+# Launched programs are detached from the app: no console, no inherited handles
+if sys.platform == "win32":
+    LAUNCH_OPTIONS = {
+        "creationflags": subprocess.CREATE_NEW_PROCESS_GROUP | subprocess.DETACHED_PROCESS
+    }
+else:
+    LAUNCH_OPTIONS = {"start_new_session": True}
 
 
 def _norm_path(p: str) -> str:
-    """Normalizes the folder path by removing extra spaces."""
-    return p.strip()
+    """
+    Normalizes the folder path by removing extra spaces and outer slashes
+    (the same form the folder tree uses for its node ids).
+    Paths are normalized once when they enter the app, so they can be compared as is.
+    The result is interned: contacts of one folder share a single string object.
+    """
+    return sys.intern(p.strip().strip("/"))
+
+
+def _write_contacts_file(rows: list[list[str]]):
+    """Rewrites the CSV with the rows; a temporary file keeps the old one intact on failure."""
+    tmp_file = CONTACTS_FILE + ".tmp"
+    try:
+        with open(tmp_file, "w", newline="", encoding="utf-8", buffering=1 << 20) as f:
+            writer = csv.writer(f)
+            writer.writerow(CSV_HEADER)
+            writer.writerows(rows)
+        os.replace(tmp_file, CONTACTS_FILE)
+    except Exception:
+        try:
+            os.remove(tmp_file)
+        except OSError:
+            pass
+        raise
+
 
+def _append_contacts_file(row: list[str]):
+    """Appends a single row to the end of the CSV without rewriting it."""
+    with open(CONTACTS_FILE, "a", newline="", encoding="utf-8") as f:
+        csv.writer(f).writerow(row)
 
-@dataclass
+
+@dataclass(slots=True)
 class Contact:
     folder_path: str      # Path to folder in the form "Folder/Subfolder"
     name: str
@@ -106,9 +181,35 @@ class ContactManagerApp(tk.Tk):
 
         self.contacts: list[Contact] = []
         self.folder_path_to_id: dict[str, str] = {}
-        self.drag_data = None  # {'contact_idx': int, 'start_x': int, 'start_y': int, 'dragged': bool}
+        # Folder path -> sorted global indices of its contacts in self.contacts.
+        # Filtering by folder reads only this map, never the Contact records.
+        self._folder_index: dict[str, list[int]] = {}
+        # iid -> values of the rows currently shown in the contacts table
+        self._displayed_rows: dict[str, tuple] = {}
+        # Large folders are displayed by window: position of its first row in the folder
+        self._virtual = False
+        self._table_first = 0
+        self._rewindow_pending = False
+        # {'contact_idx': int, 'start_x': int, 'start_y': int, 'dragged': bool,
+        #  'tree_rooty': int, 'tree_rows': dict[int, str]}
+        self.drag_data = None
+        self._pending_motion: dict = {}  # Motion handler -> latest event not processed yet
+        self._motion_after_id = None
+        self._last_hover_node = None  # Folder last highlighted during the current drag
+        self._last_opened_node = None  # Folder last opened by hovering during the current drag
         self.current_folder = ""
-
+        self._save_after_id = None  # Pending after() job of a deferred save
+        # True if the file has exactly CSV_HEADER, so rows can be appended to it as is
+        self._can_append = False
+        # True after a write failed: the file lags behind and must be rewritten in full
+        self._save_failed = False
+        # Writes ("write", rows) / ("append", row) are done by a background thread
+        self._save_queue: queue.Queue = queue.Queue()
+        self._save_thread = threading.Thread(target=self._save_worker, daemon=True)
+        self._save_thread.start()
+        self._exe_cache: dict[str, str] = {}  # Program name -> resolved executable
+
+        self.protocol("WM_DELETE_WINDOW", self.on_close)
         self.load_contacts()
         self.create_widgets()
         self.build_folder_tree()
@@ -119,44 +220,141 @@ class ContactManagerApp(tk.Tk):
     # ---------------------------------------------------------------------------
     def load_contacts(self):
         self.contacts.clear()
+        self._folder_index = {}
+        self._can_append = False
         if not os.path.exists(CONTACTS_FILE):
             with open(CONTACTS_FILE, "w", newline="", encoding="utf-8") as f:
                 writer = csv.writer(f)
-                writer.writerow(
-                    ["folder", "name", "ammyadmin_id", "anydesk_id", "rustdesk_id", "notes"]
-                )
+                writer.writerow(CSV_HEADER)
+            self._can_append = True
             return
+        n_cols = len(CSV_HEADER)
         with open(CONTACTS_FILE, "r", newline="", encoding="utf-8") as f:
-            reader = csv.DictReader(f)
+            reader = csv.reader(f)
+            header = next(reader, None)
+            if header is None:
+                return
+            self._can_append = header == CSV_HEADER
+            # Column positions are resolved once; None means the file follows CSV_HEADER
+            positions = None
+            if header[:n_cols] != CSV_HEADER:
+                positions = [header.index(col) if col in header else None for col in CSV_HEADER]
             for row in reader:
-                self.contacts.append(
-                    Contact(
-                        folder_path=_norm_path(row["folder"]),
-                        name=row["name"],
-                        ammyadmin_id=row.get("ammyadmin_id", ""),
-                        anydesk_id=row.get("anydesk_id", ""),
-                        rustdesk_id=row.get("rustdesk_id", ""),
-                        notes=row.get("notes", ""),
-                    )
-                )
+                if not row:
+                    continue  # Blank line
+                if positions is not None:
+                    row = [
+                        row[p] if p is not None and p < len(row) else ""
+                        for p in positions
+                    ]
+                elif len(row) < n_cols:
+                    row += [""] * (n_cols - len(row))
+                folder = _norm_path(row[0])
+                self._folder_index.setdefault(folder, []).append(len(self.contacts))
+                self.contacts.append(Contact(folder, *row[1:n_cols]))
+        # An appended row must not be glued to an unterminated last line
+        if self._can_append:
+            with open(CONTACTS_FILE, "rb") as f:
+                f.seek(-1, os.SEEK_END)
+                self._can_append = f.read(1) in (b"\n", b"\r")
+
+    def _remove_contacts(self, deleted: set[int]):
+        """
+        Removes the contacts at the given indices.
+        The indices of the remaining contacts shift, so the folder index
+        is rebuilt in the same pass over the list.
+        """
+        contacts: list[Contact] = []
+        folder_index: dict[str, list[int]] = {}
+        for idx, contact in enumerate(self.contacts):
+            if idx not in deleted:
+                folder_index.setdefault(contact.folder_path, []).append(len(contacts))
+                contacts.append(contact)
+        self.contacts = contacts
+        self._folder_index = folder_index
 
     def save_contacts(self):
-        with open(CONTACTS_FILE, "w", newline="", encoding="utf-8") as f:
-            writer = csv.writer(f)
-            writer.writerow(
-                ["folder", "name", "ammyadmin_id", "anydesk_id", "rustdesk_id", "notes"]
-            )
-            for c in self.contacts:
-                writer.writerow(
-                    [
-                        c.folder_path,
-                        c.name,
-                        c.ammyadmin_id,
-                        c.anydesk_id,
-                        c.rustdesk_id,
-                        c.notes,
-                    ]
-                )
+        """Hands a snapshot of all contacts over to the writer thread."""
+        self._save_queue.put(("write", [self._csv_row(c) for c in self.contacts]))
+        self._can_append = True  # The rewrite uses CSV_HEADER
+        self._save_failed = False
+
+    def _append_contact(self, contact: Contact):
+        """Has the writer thread append a single contact to the end of the CSV."""
+        self._save_queue.put(("append", self._csv_row(contact)))
+
+    def _save_worker(self):
+        """
+        Writer thread: performs the queued writes in order until it gets None.
+        A full rewrite makes everything queued before it redundant, so it is skipped.
+        """
+        while True:
+            jobs = [self._save_queue.get()]
+            while True:
+                try:
+                    jobs.append(self._save_queue.get_nowait())
+                except queue.Empty:
+                    break
+            for i in range(len(jobs) - 1, 0, -1):
+                if jobs[i] is not None and jobs[i][0] == "write":
+                    del jobs[:i]
+                    break
+            for job in jobs:
+                if job is None:
+                    return
+                kind, data = job
+                try:
+                    if kind == "write":
+                        _write_contacts_file(data)
+                    else:
+                        _append_contacts_file(data)
+                except Exception as e:
+                    # Keep serving later saves; the message is shown by the Tk thread
+                    self.after(0, self._report_save_error, e)
+
+    def _report_save_error(self, error: Exception):
+        # Appending to the stale file would drop the lost changes for good
+        self._can_append = False
+        self._save_failed = True
+        messagebox.showerror("Error", f"Failed to save contacts: {error}", parent=self)
+
+    @staticmethod
+    def _csv_row(contact: Contact) -> list[str]:
+        """CSV row for the contact (column order as in the header)."""
+        return [
+            contact.folder_path,
+            contact.name,
+            contact.ammyadmin_id,
+            contact.anydesk_id,
+            contact.rustdesk_id,
+            contact.notes,
+        ]
+
+    def _schedule_save(self):
+        """Defers save_contacts() so that a burst of changes results in one write."""
+        if self._save_after_id is None:
+            self._save_after_id = self.after(SAVE_DELAY_MS, self._flush_save)
+
+    def _flush_save(self):
+        """Performs the deferred save right away (if one is pending or the last one failed)."""
+        if self._save_after_id is not None:
+            self.after_cancel(self._save_after_id)
+            self._save_after_id = None
+        elif not self._save_failed:
+            return
+        self.save_contacts()
+
+    def on_close(self):
+        """Writes pending changes before the window is destroyed."""
+        # The wait below processes events; a second close request must not destroy twice
+        self.protocol("WM_DELETE_WINDOW", lambda: None)
+        self._flush_save()
+        self._save_queue.put(None)
+        # Keep processing events: the writer may need the Tk thread to report an error
+        while self._save_thread.is_alive():
+            self._save_thread.join(0.05)
+            self.update()
+        self.destroy()
 
     # ---------------------------------------------------------------------------
     # Building the GUI
@@ -209,11 +407,13 @@ class ContactManagerApp(tk.Tk):
             self.contacts_table.column(col, width=150, anchor="w")
         self.contacts_table.pack(fill=tk.BOTH, expand=True, side=tk.LEFT)
 
-        sb_vert = ttk.Scrollbar(
-            contacts_frame, orient=tk.VERTICAL, command=self.contacts_table.yview
+        self._row_height = int(ttk.Style(self).lookup("Treeview", "rowheight") or 20)
+
+        self.contacts_vsb = ttk.Scrollbar(
+            contacts_frame, orient=tk.VERTICAL, command=self._table_yview
         )
-        sb_vert.pack(side=tk.RIGHT, fill=tk.Y)
-        self.contacts_table.configure(yscrollcommand=sb_vert.set)
+        self.contacts_vsb.pack(side=tk.RIGHT, fill=tk.Y)
+        self.contacts_table.configure(yscrollcommand=self._on_table_yscroll)
 
         sb_horiz = ttk.Scrollbar(
             contacts_frame, orient=tk.HORIZONTAL, command=self.contacts_table.xview
@@ -237,30 +437,43 @@ class ContactManagerApp(tk.Tk):
     # Folder tree
     # ---------------------------------------------------------------------------
     def build_folder_tree(self):
+        """
+        Builds the whole folder tree from the folders of the loaded contacts.
+        Called once at startup; adding and deleting folders edit the tree in place.
+        """
         self.folder_tree.delete(*self.folder_tree.get_children())
         # Root node
         self.folder_tree.insert("", "end", "__root__", text="Root", open=True)
         self.folder_path_to_id = {"": "__root__"}
 
-        # Collect all unique paths from contacts
-        paths = {c.folder_path for c in self.contacts}
-        paths.add("")  # Ensure root is present
-
-        for path in sorted(paths):
-            if path == "":
-                continue
-            parts = path.strip("/").split("/")
-            cur = ""
-            parent_id = "__root__"
-            for part in parts:
-                cur = f"{cur}/{part}" if cur else part
-                if cur not in self.folder_path_to_id:
-                    node_id = cur
-                    self.folder_tree.insert(parent_id, "end", node_id, text=part, open=False)
-                    self.folder_path_to_id[cur] = node_id
-                    parent_id = node_id
-                else:
-                    parent_id = self.folder_path_to_id[cur]
+        # Merge all unique folder paths into a trie: part -> subtree.
+        # Each path is attached to its nearest already known ancestor, so prefixes
+        # shared by many paths are resolved with a single lookup.
+        trie: dict[str, dict] = {}
+        known: dict[str, dict] = {"": trie}  # Folder path -> its subtree
+        for path in self._folder_index:
+            missing = []
+            while path not in known:
+                parent, _, part = path.rpartition("/")
+                missing.append((path, part))
+                path = parent
+            node = known[path]
+            for sub_path, part in reversed(missing):
+                child: dict[str, dict] = {}
+                node[part] = child
+                known[sub_path] = child
+                node = child
+
+        # Walk the trie once, inserting each folder right after its parent.
+        # Siblings are ordered by folder name ("A" before "A B").
+        stack = [("__root__", "", trie)]
+        while stack:
+            parent_id, parent_path, node = stack.pop()
+            for part in sorted(node):
+                node_id = f"{parent_path}/{part}" if parent_path else part
+                self.folder_tree.insert(parent_id, "end", node_id, text=part, open=False)
+                self.folder_path_to_id[node_id] = node_id
+                stack.append((node_id, node_id, node[part]))
 
     def select_root(self):
         self.folder_tree.selection_set("__root__")
@@ -269,33 +482,144 @@ class ContactManagerApp(tk.Tk):
     def on_folder_select(self, event):
         sel = self.folder_tree.selection()
         if not sel:
-            self.current_folder = ""
+            folder = ""
         else:
             node_id = sel[0]
-            self.current_folder = "" if node_id == "__root__" else node_id
+            folder = "" if node_id == "__root__" else _norm_path(node_id)
+        if folder != self.current_folder:
+            self.current_folder = folder
+            self._table_first = 0
+            self.contacts_table.yview_moveto(0)
+        # Clicking a folder deselects contacts, so Delete then targets the folder
+        self.contacts_table.selection_remove(self.contacts_table.selection())
         self.refresh_contacts_table()
 
     # ---------------------------------------------------------------------------
     # Contacts table
     # ---------------------------------------------------------------------------
     def refresh_contacts_table(self):
-        """Displays only contacts in the current folder (including root)."""
-        self.contacts_table.delete(*self.contacts_table.get_children())
-        folder = self.current_folder
-        for idx, contact in enumerate(self.contacts):
-            if _norm_path(contact.folder_path) == _norm_path(folder):
-                self.contacts_table.insert(
-                    "",
-                    "end",
-                    iid=str(idx),
-                    values=(
-                        contact.name,
-                        contact.ammyadmin_id,
-                        contact.anydesk_id,
-                        contact.rustdesk_id,
-                        contact.notes,
-                    ),
-                )
+        """
+        Displays only contacts in the current folder (including root).
+        Only the rows that differ from what is already displayed are touched.
+        Folders with at least VIRTUAL_ROWS_MIN contacts are displayed by window:
+        only the rows from self._table_first up to a few screens further are inserted.
+        """
+        folder_indices = self._folder_index.get(self.current_folder, ())
+        self._virtual = len(folder_indices) >= VIRTUAL_ROWS_MIN
+        if self._virtual:
+            window = self._visible_rows() + 2 * VIRTUAL_BUFFER
+            self._table_first = max(0, min(self._table_first, len(folder_indices) - window))
+            folder_indices = folder_indices[self._table_first:self._table_first + window]
+        else:
+            self._table_first = 0
+        contacts = self.contacts
+        rows = {str(idx): self._row_values(contacts[idx]) for idx in folder_indices}
+        displayed = self._displayed_rows
+        table = self.contacts_table
+        stale = [iid for iid in displayed if iid not in rows]
+        if stale:
+            table.delete(*stale)
+        for iid, values in rows.items():
+            old_values = displayed.get(iid)
+            if old_values is None:
+                table.insert("", "end", iid=iid, values=values)
+            elif old_values != values:
+                table.item(iid, values=values)
+        order = tuple(rows)
+        if table.get_children() != order:
+            table.set_children("", *order)
+        self._displayed_rows = rows
+
+    def _patch_row(self, idx: int):
+        """Brings a single row of the contacts table in line with the contact."""
+        if self._virtual or len(self._folder_index.get(self.current_folder, ())) >= VIRTUAL_ROWS_MIN:
+            # The row may lie outside the window; the refresh works out what to touch
+            self.refresh_contacts_table()
+            return
+        iid = str(idx)
+        contact = self.contacts[idx]
+        displayed = self._displayed_rows
+        if contact.folder_path != self.current_folder:
+            if displayed.pop(iid, None) is not None:
+                self.contacts_table.delete(iid)
+            return
+        values = self._row_values(contact)
+        if iid not in displayed:
+            pos = bisect.bisect_left(self._folder_index[contact.folder_path], idx)
+            self.contacts_table.insert("", pos, iid=iid, values=values)
+        elif displayed[iid] != values:
+            self.contacts_table.item(iid, values=values)
+        displayed[iid] = values
+
+    def _visible_rows(self) -> int:
+        """Number of rows that fit into the contacts table."""
+        return max(1, self.contacts_table.winfo_height() // self._row_height)
+
+    def _on_table_yscroll(self, lo, hi):
+        """
+        yscrollcommand of the contacts table.
+        For a large folder, maps the view of the window onto the whole folder
+        and shifts the window when the view gets close to one of its edges.
+        """
+        if not self._virtual:
+            self.contacts_vsb.set(lo, hi)
+            return
+        total = len(self._folder_index.get(self.current_folder, ()))
+        shown = len(self._displayed_rows)
+        top = self._table_first + round(float(lo) * shown)
+        bottom = self._table_first + round(float(hi) * shown)
+        self.contacts_vsb.set(top / total, bottom / total)
+        if not self._rewindow_pending and self._window_needs_shift(top, bottom - top):
+            self._rewindow_pending = True
+            self.after_idle(self._sync_table_window)
+
+    def _table_yview(self, *args):
+        """Scrollbar command of the contacts table."""
+        if self._virtual and args[0] == "moveto":
+            total = len(self._folder_index.get(self.current_folder, ()))
+            self._scroll_table_to(round(float(args[1]) * total))
+        else:
+            # Scrolling by units/pages stays within the window, which follows the view
+            self.contacts_table.yview(*args)
+
+    def _window_needs_shift(self, top: int, visible: int) -> bool:
+        """True if fewer than half a buffer of rows is left beyond the view."""
+        first = self._table_first
+        last = first + len(self._displayed_rows)
+        total = len(self._folder_index.get(self.current_folder, ()))
+        margin = VIRTUAL_BUFFER // 2
+        return (first > 0 and top - first < margin) or (
+            last < total and last - (top + visible) < margin
+        )
+
+    def _sync_table_window(self):
+        """Recenters the window of a large folder around its current view."""
+        self._rewindow_pending = False
+        if self._virtual:
+            lo, _ = self.contacts_table.yview()
+            self._scroll_table_to(self._table_first + round(lo * len(self._displayed_rows)))
+
+    def _scroll_table_to(self, top: int):
+        """Scrolls a large folder so that its row at position top is the first one in view."""
+        total = len(self._folder_index.get(self.current_folder, ()))
+        visible = self._visible_rows()
+        top = max(0, min(top, total - visible))
+        if self._window_needs_shift(top, visible):
+            self._table_first = max(0, top - VIRTUAL_BUFFER)
+            self.refresh_contacts_table()
+        if self._displayed_rows:
+            self.contacts_table.yview_moveto((top - self._table_first) / len(self._displayed_rows))
+
+    @staticmethod
+    def _row_values(contact: Contact) -> tuple:
+        """Values of the contacts table row for the contact."""
+        return (
+            contact.name,
+            contact.ammyadmin_id,
+            contact.anydesk_id,
+            contact.rustdesk_id,
+            contact.notes,
+        )
 
     # ---------------------------------------------------------------------------
     # Operations on data (add/edit/delete)
@@ -336,18 +660,24 @@ class ContactManagerApp(tk.Tk):
         )
 
     def _add_contact_callback(self, name, ammy, anydesk, rustdesk, notes):
-        self.contacts.append(
-            Contact(
-                folder_path=self.current_folder,
-                name=name,
-                ammyadmin_id=ammy,
-                anydesk_id=anydesk,
-                rustdesk_id=rustdesk,
-                notes=notes,
-            )
+        contact = Contact(
+            folder_path=self.current_folder,
+            name=name,
+            ammyadmin_id=ammy,
+            anydesk_id=anydesk,
+            rustdesk_id=rustdesk,
+            notes=notes,
         )
-        self.save_contacts()
-        self.refresh_contacts_table()
+        self._folder_index.setdefault(self.current_folder, []).append(len(self.contacts))
+        self.contacts.append(contact)
+        if self._save_after_id is None and self._can_append:
+            # The file is up to date - the new contact just goes to its end
+            self._append_contact(contact)
+        else:
+            # The pending save writes it together with the other changes;
+            # a file in another layout is rewritten with CSV_HEADER
+            self._schedule_save()
+        self._patch_row(len(self.contacts) - 1)
 
     def edit_selected(self):
         sel = self.contacts_table.selection()
@@ -364,8 +694,8 @@ class ContactManagerApp(tk.Tk):
             contact.anydesk_id = anydesk
             contact.rustdesk_id = rustdesk
             contact.notes = notes
-            self.save_contacts()
-            self.refresh_contacts_table()
+            self._schedule_save()
+            self._patch_row(idx)
 
         ContactDialog(
             self,
@@ -383,10 +713,12 @@ class ContactManagerApp(tk.Tk):
                 "Delete", "Delete selected contacts?", parent=self
             ):
                 return
-            indices = sorted([int(iid) for iid in sel_contacts], reverse=True)
-            for i in indices:
-                del self.contacts[i]
-            self.save_contacts()
+            # Drop the rows first: the remaining iids shift onto other contacts
+            self.contacts_table.delete(*sel_contacts)
+            for iid in sel_contacts:
+                del self._displayed_rows[iid]
+            self._remove_contacts({int(iid) for iid in sel_contacts})
+            self._schedule_save()
             self.refresh_contacts_table()
             return
 
@@ -407,9 +739,14 @@ class ContactManagerApp(tk.Tk):
             return
         folder_path = node_id
         # Remove contacts from this folder and all subfolders
-        self.contacts = [
-            c for c in self.contacts if not c.folder_path.startswith(folder_path)
-        ]
+        deleted = {
+            idx
+            for fp, indices in self._folder_index.items()
+            if fp == folder_path or fp.startswith(folder_path + "/")
+            for idx in indices
+        }
+        if deleted:
+            self._remove_contacts(deleted)
         # Remove tree node and its children
         self.folder_tree.delete(node_id)
         to_remove = [
@@ -419,8 +756,8 @@ class ContactManagerApp(tk.Tk):
         ]
         for fp in to_remove:
             del self.folder_path_to_id[fp]
-        self.save_contacts()
-        self.refresh_contacts_table()
+        self._schedule_save()
+        # Selecting the root refreshes the contacts table
         self.select_root()
 
     # ---------------------------------------------------------------------------
@@ -448,30 +785,39 @@ class ContactManagerApp(tk.Tk):
             "start_x": event.x_root,
             "start_y": event.y_root,
             "dragged": False,
+            # Neither changes while the button is held: the window cannot move,
+            # and the rows only shift when a folder is opened (they are then forgotten)
+            "tree_rooty": self.folder_tree.winfo_rooty(),
+            "tree_rows": {},  # y within the folder tree -> identify_row() result
         }
+        self._last_hover_node = None
+        self._last_opened_node = None
         self.contacts_table.configure(cursor="hand2")
 
     def on_drag_motion(self, event):
         """Tracks if the user has exceeded the threshold movement."""
         if not self.drag_data:
             return
+        # Checked right away: a release before the queued motion runs is still a drag
         dx = event.x_root - self.drag_data["start_x"]
         dy = event.y_root - self.drag_data["start_y"]
-        if not self.drag_data["dragged"] and math.hypot(dx, dy) >= DRAG_THRESHOLD:
+        if not self.drag_data["dragged"] and dx * dx + dy * dy >= _DRAG_THRESHOLD_SQ:
             self.drag_data["dragged"] = True
-
-        # Highlight folder under cursor
         if self.drag_data["dragged"]:
-            x_root, y_root = self.winfo_pointerx(), self.winfo_pointery()
-            widget_under = self.winfo_containing(x_root, y_root)
+            self._coalesce_motion(self._process_drag_motion, event)
+
+    def _process_drag_motion(self, event):
+        """Highlights the folder under the cursor."""
+        if self.drag_data:
+            widget_under = self.winfo_containing(event.x_root, event.y_root)
             if widget_under is self.folder_tree:
-                rel_y = y_root - self.folder_tree.winfo_rooty()
-                node = self.folder_tree.identify_row(rel_y)
+                node = self._tree_row_at(event.y_root - self.drag_data["tree_rooty"])
                 if node:
-                    self.folder_tree.selection_set(node)
+                    self._hover_folder(node)
 
     def on_end_drag(self, event):
         """Handles mouse button release - moves folder or reorders."""
+        self._cancel_motion()
         if not self.drag_data:
             return
 
@@ -500,10 +846,10 @@ class ContactManagerApp(tk.Tk):
                 # Expand the node (useful for nested folders)
                 self.folder_tree.item(node_id, open=True)
 
-                new_folder = "" if node_id == "__root__" else node_id
+                new_folder = "" if node_id == "__root__" else _norm_path(node_id)
                 if source_contact.folder_path != new_folder:
-                    source_contact.folder_path = new_folder
-                    self.save_contacts()
+                    self._set_contact_folder(source_idx, new_folder)
+                    self._schedule_save()
                     # Switch to the new folder immediately to show the result
                     self.folder_tree.selection_set(node_id)
                     self.on_folder_select(event=None)
@@ -516,9 +862,10 @@ class ContactManagerApp(tk.Tk):
                 rel_y = y_root - self.contacts_table.winfo_rooty()
                 target_row = self.contacts_table.identify_row(rel_y)
 
+                new_idx = source_idx
                 if not target_row:
                     # Dropped on empty area - move to end of current folder
-                    self._move_contact_to_end_of_folder(source_idx)
+                    new_idx = self._move_contact_to_end_of_folder(source_idx)
                 else:
                     target_idx = int(target_row)
                     if target_idx != source_idx:
@@ -526,17 +873,16 @@ class ContactManagerApp(tk.Tk):
 
                         if target_contact.folder_path == source_contact.folder_path:
                             # Reorder within the same folder
-                            self._reorder_within_folder(source_idx, target_idx)
+                            new_idx = self._reorder_within_folder(source_idx, target_idx)
                         else:
                             # Move to another folder (after target contact)
-                            self._move_contact_to_folder_at_position(
+                            new_idx = self._move_contact_to_folder_at_position(
                                 source_idx, target_contact.folder_path, target_idx
                             )
-                self.save_contacts()
+                self._schedule_save()
                 self.refresh_contacts_table()
 
                 # Select the moved contact if visible in the current folder
-                new_idx = self.contacts.index(source_contact)
                 if self.current_folder == source_contact.folder_path:
                     if self.contacts_table.exists(str(new_idx)):
                         self.contacts_table.selection_set(str(new_idx))
@@ -550,57 +896,120 @@ class ContactManagerApp(tk.Tk):
     # ---------------------------------------------------------------------------
     # Helper methods for drag-and-drop
     # ---------------------------------------------------------------------------
-    def _move_contact_to_end_of_folder(self, source_idx: int):
-        """Moves the contact to the end of its current folder."""
-        contact = self.contacts.pop(source_idx)
-        folder = contact.folder_path
-        # Find the last element in the same folder
-        last_idx = None
-        for i, c in enumerate(self.contacts):
-            if c.folder_path == folder:
-                last_idx = i
-        if last_idx is None:
-            self.contacts.append(contact)
-        else:
-            self.contacts.insert(last_idx + 1, contact)
-
-    def _reorder_within_folder(self, source_idx: int, target_idx: int):
-        """Moves the contact within the same folder (preserving order)."""
+    def _set_contact_folder(self, idx: int, folder: str):
+        """Moves the contact to another folder, keeping its position in self.contacts."""
+        contact = self.contacts[idx]
+        old_indices = self._folder_index[contact.folder_path]
+        del old_indices[bisect.bisect_left(old_indices, idx)]
+        if not old_indices:
+            del self._folder_index[contact.folder_path]
+        bisect.insort(self._folder_index.setdefault(folder, []), idx)
+        contact.folder_path = folder
+
+    def _move_contact_to_end_of_folder(self, source_idx: int) -> int:
+        """Moves the contact to the end of its current folder. Returns its new index."""
         folder = self.contacts[source_idx].folder_path
-        folder_indices = [i for i, c in enumerate(self.contacts) if c.folder_path == folder]
-        src_pos = folder_indices.index(source_idx)
-        tgt_pos = folder_indices.index(target_idx)
+        last_idx = self._folder_index[folder][-1]
+        if last_idx == source_idx:
+            return source_idx
+        return self._reorder_within_folder(source_idx, last_idx)
 
-        folder_contacts = [self.contacts[i] for i in folder_indices]
-        contact_obj = folder_contacts.pop(src_pos)
-        folder_contacts.insert(tgt_pos, contact_obj)
-
-        for local_i, global_i in enumerate(folder_indices):
-            self.contacts[global_i] = folder_contacts[local_i]
-
-    def _move_contact_to_folder_at_position(self, source_idx: int, target_folder: str, target_idx: int):
+    def _reorder_within_folder(self, source_idx: int, target_idx: int) -> int:
+        """
+        Moves the contact within the same folder (preserving order).
+        Contacts are permuted among the folder's own slots, so the folder index
+        and the positions of other folders' contacts stay unchanged.
+        The contact takes the slot of the target, which is returned as its new index.
+        """
+        folder = self.contacts[source_idx].folder_path
+        folder_indices = self._folder_index[folder]
+        src_pos = bisect.bisect_left(folder_indices, source_idx)
+        tgt_pos = bisect.bisect_left(folder_indices, target_idx)
+
+        lo, hi = min(src_pos, tgt_pos), max(src_pos, tgt_pos)
+        slots = folder_indices[lo:hi + 1]
+        folder_contacts = [self.contacts[i] for i in slots]
+        contact_obj = folder_contacts.pop(src_pos - lo)
+        folder_contacts.insert(tgt_pos - lo, contact_obj)
+
+        for global_i, contact in zip(slots, folder_contacts):
+            self.contacts[global_i] = contact
+        return target_idx
+
+    def _move_contact_to_folder_at_position(
+        self, source_idx: int, target_folder: str, target_idx: int
+    ) -> int:
         """
         Moves the contact to another folder and places it right after the target contact.
+        Returns the new index of the contact.
         """
-        contact = self.contacts.pop(source_idx)
-        contact.folder_path = target_folder
+        self._set_contact_folder(source_idx, target_folder)
 
-        insert_pos = target_idx
-        if source_idx < target_idx:
-            insert_pos -= 1  # Adjustment due to the already removed element
-        self.contacts.insert(insert_pos + 1, contact)
+        folder_indices = self._folder_index[target_folder]
+        src_pos = bisect.bisect_left(folder_indices, source_idx)
+        tgt_pos = bisect.bisect_left(folder_indices, target_idx)
+        if src_pos > tgt_pos:
+            tgt_pos += 1  # The target stays in place when the source is popped after it
+        if src_pos == tgt_pos:
+            return source_idx
+        return self._reorder_within_folder(source_idx, folder_indices[tgt_pos])
 
     # ---------------------------------------------------------------------------
     # Folder highlighting during drag (and auto-preview)
     # ---------------------------------------------------------------------------
     def on_folder_highlight(self, event):
         """During dragging, highlights (and opens) the folder under the cursor."""
+        if self.drag_data and self.drag_data["dragged"]:
+            self._coalesce_motion(self._process_folder_highlight, event)
+
+    def _process_folder_highlight(self, event):
         if not self.drag_data or not self.drag_data["dragged"]:
             return
-        node = self.folder_tree.identify_row(event.y)
+        node = self._tree_row_at(event.y)
         if node:
+            self._hover_folder(node, open_node=True)
+
+    def _tree_row_at(self, y: int) -> str:
+        """identify_row() of the folder tree, remembered for the rest of the drag."""
+        tree_rows = self.drag_data["tree_rows"]
+        node = tree_rows.get(y)
+        if node is None:
+            node = tree_rows[y] = self.folder_tree.identify_row(y)
+        return node
+
+    def _hover_folder(self, node: str, open_node: bool = False):
+        """Selects (and opens) the folder once, when the cursor enters it."""
+        if node != self._last_hover_node:
+            self._last_hover_node = node
             self.folder_tree.selection_set(node)
+        # Tracked separately: the node may already be selected by the table's motion handler
+        if open_node and node != self._last_opened_node:
+            self._last_opened_node = node
             self.folder_tree.item(node, open=True)
+            self.drag_data["tree_rows"].clear()  # Rows below the node have moved
+
+    def _coalesce_motion(self, handler, event):
+        """
+        Queues handler(event) to run after MOTION_INTERVAL_MS.
+        Events arriving in the meantime only replace the queued one,
+        so a burst of motion events is handled once, with the latest position.
+        """
+        if not self._pending_motion:
+            self._motion_after_id = self.after(MOTION_INTERVAL_MS, self._process_motion)
+        self._pending_motion[handler] = event
+
+    def _process_motion(self):
+        self._motion_after_id = None
+        pending, self._pending_motion = self._pending_motion, {}
+        for handler, event in pending.items():
+            handler(event)
+
+    def _cancel_motion(self):
+        """Drops motion events that have not been processed yet."""
+        if self._motion_after_id is not None:
+            self.after_cancel(self._motion_after_id)
+            self._motion_after_id = None
+        self._pending_motion.clear()
 
     # ---------------------------------------------------------------------------
     # Launching remote access program
@@ -613,10 +1022,9 @@ class ContactManagerApp(tk.Tk):
         idx = int(row_id)
         contact = self.contacts[idx]
         col_num = int(col_id.replace("#", ""))
-        prog_map = {2: "ammyadmin", 3: "anydesk", 4: "rustdesk"}
-        if col_num not in prog_map:
+        prog = _PROG_MAP.get(col_num)
+        if prog is None:
             return
-        prog = prog_map[col_num]
         remote_id = getattr(contact, f"{prog}_id")
         if not remote_id:
             messagebox.showinfo(
@@ -625,7 +1033,8 @@ class ContactManagerApp(tk.Tk):
                 parent=self,
             )
             return
-        self.launch_program(prog, remote_id)
+        # Let the double-click handler return before the program is started
+        self.after_idle(self.launch_program, prog, remote_id)
 
     def find_executable(self, prog_name: str) -> str | None:
         """
@@ -635,19 +1044,23 @@ class ContactManagerApp(tk.Tk):
         2) Current working directory (where contacts.csv is).
         3) Standard Windows installation paths.
         4) System PATH (via shutil.which).
+        A found executable is remembered, so the search runs once per program.
         """
-        exe_name_map = {
-            "ammyadmin": "AmmyyAdmin.exe",
-            "anydesk": "AnyDesk.exe",
-            "rustdesk": "rustdesk.exe",
-        }
-        exe_name = exe_name_map.get(prog_name)
+        exe = self._exe_cache.get(prog_name)
+        if exe is None:
+            exe = self._search_executable(prog_name)
+            if exe:
+                self._exe_cache[prog_name] = exe
+        return exe
+
+    def _search_executable(self, prog_name: str) -> str | None:
+        """Looks up the executable on disk in the order described in find_executable."""
+        exe_name = EXE_NAMES.get(prog_name)
         if not exe_name:
             return None
 
         # 1) Script directory
-        script_dir = os.path.abspath(os.path.dirname(__file__))
-        script_path = os.path.join(script_dir, exe_name)
+        script_path = os.path.join(SCRIPT_DIR, exe_name)
         if os.path.isfile(script_path):
             return script_path
 
@@ -657,22 +1070,7 @@ class ContactManagerApp(tk.Tk):
             return cwd_path
 
         # 3) Standard installation locations
-        candidates = {
-            "ammyadmin": [
-                r"C:\Program Files (x86)\Ammyy Admin\AmmyyAdmin.exe",
-                r"C:\Program Files\Ammyy Admin\AmmyyAdmin.exe",
-            ],
-            "anydesk": [
-                r"C:\Program Files (x86)\AnyDesk\AnyDesk.exe",
-                r"C:\Program Files\AnyDesk\AnyDesk.exe",
-            ],
-            "rustdesk": [
-                r"C:\Program Files\RustDesk\rustdesk.exe",
-                r"C:\Program Files (x86)\RustDesk\rustdesk.exe",
-            ],
-        }.get(prog_name, [])
-
-        for p in candidates:
+        for p in EXE_INSTALL_PATHS.get(prog_name, []):
             if os.path.isfile(p):
                 return p
 
@@ -692,24 +1090,22 @@ class ContactManagerApp(tk.Tk):
             )
             return
 
-        # Form the argument list depending on the program
-        args = [exe]
-        if prog_name == "ammyadmin":
-            # AmmyyAdmin requires -connect flag
-            args += ["-connect", remote_id]
-        elif prog_name == "anydesk":
-            # AnyDesk accepts just the ID
-            args += [remote_id]
-        elif prog_name == "rustdesk":
-            # RustDesk requires --connect flag
-            args += ["--connect", remote_id]
-        else:
-            # For potential new programs
-            args += [remote_id]
+        # Potential new programs without flags just get the ID
+        args = (exe, *_LAUNCH_FLAGS.get(prog_name, ()), remote_id)
 
         try:
-            subprocess.Popen(args, shell=False)
+            subprocess.Popen(
+                args,
+                shell=False,
+                close_fds=True,
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                **LAUNCH_OPTIONS,
+            )
         except Exception as e:
+            # The cached executable may have been moved or uninstalled
+            self._exe_cache.pop(prog_name, None)
             messagebox.showerror(
                 "Error",
                 f"Failed to launch {prog_name.title()}: {e}",